@@ -1,6 +1,34 @@
 #!/bin/env python
 
+import re
+import sys
+import typing
 
+from datetime import datetime
+from functools import lru_cache
+
+_DIGITS_PATTERN = re.compile(r"[0-9]+")
+"""(:class:`re.Pattern`) Matches each contiguous run of digits within a word"""
+
+_REMOVE_NON_DIGITS = str.maketrans("", "", "".join(chr(code) for code in range(128) if not chr(code).isdigit()))
+"""(:class:`dict`) A translation table that removes every ascii character that isn't a digit"""
+
+_FILE_NAME_PATTERN = re.compile(
+    r"^[^.]+"
+    r"\.t(?P<reference>[0-9]+)z"
+    r"\.(?P<configuration>[^.]+)"
+    r"\.(?P<model_type>[^.]+?)(?:_(?P<member>[0-9]+))?"
+    r"\.[^.0-9]*(?P<step>[0-9]+)?[^.]*"
+    r"\.(?P<area>[^.]+)"
+)
+"""(:class:`re.Pattern`) Matches a NWM file name like 'nwm.t00z.medium_range.channel_rt_1.f003.conus.nc'"""
+
+_FILE_ATTRIBUTE_NAMES = ("reference", "configuration", "model_type", "member", "step", "area")
+"""(:class:`tuple`) The name of each attribute returned by `parse_file_name`, in order"""
+
+
+# Loaders ask about the same few configuration directory names for every day
+@lru_cache(maxsize=4096)
 def get_int_from_word(word: str) -> [None, int]:
     """
     Attempt to pull a combined integer out of a word
@@ -8,12 +36,67 @@ def get_int_from_word(word: str) -> [None, int]:
     :param word: The word to search through
     :return: An integer if the word contains numbers, None otherwise
     """
-    individual_numbers = [character for character in word if character in string.digits]
+    # Stripping everything but the digits in a single C-level pass also joins separated runs of digits
+    digits = word.translate(_REMOVE_NON_DIGITS)
 
-    if len(individual_numbers) == 0:
+    if not digits:
         return None
 
-    return int("".join(individual_numbers))
+    if digits.isascii():
+        return int(digits)
+
+    # Anything left over that isn't ascii can't be counted on to be a digit, so search for the digits directly
+    digit_runs = _DIGITS_PATTERN.findall(word)
+    return int("".join(digit_runs)) if digit_runs else None
+
+
+def get_date_from_directory_name(name: str) -> datetime:
+    """
+    Read the date out of the name of a NWM day directory
+
+    :param name: The name of the directory, like 'nwm.20201014' or 'nwm.20201014/'
+    :return: The date of the forecasts within the directory
+    """
+    digits = name[4:12]
+
+    if not (
+        name.startswith("nwm.")
+        and digits.isascii()
+        and digits.isdigit()
+        and len(digits) == 8
+        and name[12:] in ("", "/")
+    ):
+        raise ValueError("'{}' is not the name of a directory of National Water Model data for a day".format(name))
+
+    # The date always sits at the same place as 'YYYYMMDD', so slicing is far cheaper than `datetime.strptime`
+    return datetime(int(name[4:8]), int(name[8:10]), int(name[10:12]))
+
+
+# File names carry no date, so every day of a catalog repeats the names of the days before it
+@lru_cache(maxsize=65536)
+def parse_file_name(filename: str) -> typing.Tuple[int, str, str, typing.Optional[int], typing.Optional[int], str]:
+    """
+    Discover NWM attributes by looking through the file name without building a dictionary for them
+
+    :param filename: The name of the file to search
+    :return: The reference, configuration, model type, member, step, and area of the file, in that order
+    """
+    match = _FILE_NAME_PATTERN.match(filename)
+
+    if match is None:
+        raise ValueError("'{}' is not the name of a National Water Model file".format(filename))
+
+    reference, configuration, model_type, member, step, area = match.groups()
+
+    # There are only a handful of distinct configurations, model types, and areas, so every file can share them
+    return (
+        int(reference),
+        sys.intern(configuration),
+        sys.intern(model_type),
+        int(member) if member else None,
+        int(step) if step else None,
+        sys.intern(area)
+    )
 
 
 def extract_file_attributes(filename: str) -> dict:
@@ -31,38 +114,4 @@ def extract_file_attributes(filename: str) -> dict:
     :param filename: The name of the file to search
     :return: A dictionary containing values describing a NWM file's attributes
     """
-    attributes = {
-        "reference": None,
-        "configuration": None,
-        "model_type": None,
-        "member": None,
-        "step": None,
-        "area": None
-    }
-
-    name_parts = filename.split(".")
-
-    # Get the reference at index 1
-    attributes["reference"] = int(name_parts[1][1:-1])
-
-    # Get the configuration at index 2
-    attributes["configuration"] = name_parts[2]
-
-    # Get the model type at index 3; if it ends in a digit, that digit needs to end up as the member and
-    # the member pattern needs to be filtered out
-    model_type_and_member = name_parts[3]
-    member = get_int_from_word(model_type_and_member)
-
-    if member is not None:
-        attributes["member"] = member
-        model_type_and_member = model_type_and_member.replace("_" + str(member), "")
-
-    attributes["model_type"] = model_type_and_member
-
-    # Get the time step at index 4
-    attributes["step"] = get_int_from_word(name_parts[4])
-
-    # Get the area at index 5
-    attributes["area"] = name_parts[5]
-
-    return attributes
+    return dict(zip(_FILE_ATTRIBUTE_NAMES, parse_file_name(filename)))
@@ -3,11 +3,45 @@
 Provides classes representing the file system structure containing National Water Model data on NOMADS
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
+import sys
 import typing
 
 import logging
 
+import numpy as np
+
+_INDEXED_FIELDS = ('reference', 'model_type', 'step', 'area', 'member')
+"""(:class:`tuple`) The columns of a `FileTable` that are indexed so that counting files doesn't need to scan them"""
+
+_NO_POSITIONS = np.empty(0, dtype=np.intp)
+"""(:class:`numpy.ndarray`) The positions of the rows holding a value that no row holds"""
+
+_DEFAULT_CONCURRENCY = 16
+"""(:class:`int`) The default number of containers to load at the same time when prefetching"""
+
+
+def _load_concurrently(load: typing.Callable[[typing.Any], None], containers: typing.Sequence, concurrency: int):
+    """
+    Call a load function on each of the given containers from a pool of threads
+
+    Loading is bound by reading listings from disk or the network, so threads can overlap the waiting
+
+    :param load: The function that loads a single container
+    :param containers: Every container to load
+    :param concurrency: The greatest number of containers to load at the same time
+    """
+    if len(containers) == 0:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(containers)))) as executor:
+        # Consuming the results raises any error that occurred while loading
+        list(executor.map(load, containers))
+
 
 class File(object):
     """
@@ -57,26 +91,225 @@ class File(object):
         self.reference: int = reference
         """(:class:`int`) The reference time between 0 and 24"""
 
-        self.type: str = configuration
+        self.type: str = sys.intern(configuration) if isinstance(configuration, str) else configuration
         """(:class:`str`) The configuration of the model (short range, medium range, long range, etc)"""
 
-        self.model_type: str = model_type
+        self.model_type: str = sys.intern(model_type) if isinstance(model_type, str) else model_type
         """(:class:`str`) The type of model (channel_rt, reservoir, land, etc)"""
 
         self.step: int = step
         """(:class:`int`) The time step of the file for the model"""
 
-        self.area: str = area
+        self.area: str = sys.intern(area) if isinstance(area, str) else area
         """(:class:`str`) What area of land the data pertains to (CONUS, Hawaii, etc)"""
 
         self.member: int = member
         """(:class:`int`) If the model was an ensemble, the identifier for the member"""
 
+    @classmethod
+    def from_parts(
+            cls,
+            name: str,
+            address: str,
+            reference: int,
+            configuration: str,
+            model_type: str,
+            member: typing.Optional[int],
+            step: typing.Optional[int],
+            area: str
+    ) -> "File":
+        """
+        Create a file straight from the tuple found by `NOMADSExplorer.common.parse_file_name`
+
+        Loaders create thousands of these at once, so this skips the argument handling of the constructor and
+        writes the slots directly
+
+        :param name: The name of the file
+        :param address: Where the file is located
+        :param reference: The reference time between 0 and 24
+        :param configuration: The configuration of the model (short range, medium range, long range, etc)
+        :param model_type: The type of model (channel_rt, reservoir, land, etc)
+        :param member: If the model was an ensemble, the identifier for the member
+        :param step: The time step of the file for the model
+        :param area: What area of land the data pertains to (CONUS, Hawaii, etc)
+        :return: The described file
+        """
+        file = object.__new__(cls)
+        file.name = name
+        file.address = address
+        file.reference = reference
+        file.type = configuration
+        file.model_type = model_type
+        file.step = step
+        file.area = area
+        file.member = member
+        return file
+
     def __str__(self):
-        return "{} ({})".format(self.name, self.address)
+        return f"{self.name} ({self.address})"
+
+    __repr__ = __str__
+
+
+class FileTable(object):
+    """
+    A columnar view of a collection of files, allowing them to be filtered and counted with vectorized operations
+    rather than by visiting each file
+    """
+
+    __slots__ = [
+        'row_count',
+        'reference',
+        'model_type',
+        'model_type_codes',
+        'step',
+        'area',
+        'area_codes',
+        'member',
+        'positions'
+    ]
+
+    def __init__(self, files: typing.Iterable[File]):
+        """
+        Constructor
+
+        :param files: The files to describe
+        """
+        files = list(files)
+        count = len(files)
+
+        self.row_count: int = count
+        """(:class:`int`) The number of described files, each of which has a row in every column"""
+
+        self.reference: np.ndarray = self._fill(map(attrgetter('reference'), files), np.int8, count)
+        """(:class:`numpy.ndarray`) The reference time of each file; -1 if the file has no reference time"""
+
+        self.model_type_codes: typing.Dict[str, int] = dict()
+        """(:class:`dict`) The code standing in for each distinct type of model"""
 
-    def __repr__(self):
-        return self.__str__()
+        self.model_type: np.ndarray = self._encode(map(attrgetter('model_type'), files), self.model_type_codes, count)
+        """(:class:`numpy.ndarray`) The code for the type of model for each file"""
+
+        self.step: np.ndarray = self._fill(map(attrgetter('step'), files), np.int32, count)
+        """(:class:`numpy.ndarray`) The time step of each file; -1 if the file has no step"""
+
+        self.area_codes: typing.Dict[str, int] = dict()
+        """(:class:`dict`) The code standing in for each distinct area of land"""
+
+        self.area: np.ndarray = self._encode(map(attrgetter('area'), files), self.area_codes, count)
+        """(:class:`numpy.ndarray`) The code for the area of land that each file pertains to"""
+
+        self.member: np.ndarray = self._fill(map(attrgetter('member'), files), np.int16, count)
+        """(:class:`numpy.ndarray`) The ensemble member of each file; -1 if the file isn't part of an ensemble"""
+
+        self.positions: typing.Dict[str, typing.Dict[int, np.ndarray]] = dict()
+        """(:class:`dict`) The positions of the rows holding each value of each column, built per column when needed"""
+
+    @staticmethod
+    def _fill(values: typing.Iterable[typing.Optional[int]], dtype: type, count: int) -> np.ndarray:
+        """
+        :param values: The integers for a column, some of which may be missing
+        :param dtype: The type of integer to hold the column
+        :param count: The number of values
+        :return: The column, with -1 standing in for every missing value
+        """
+        return np.fromiter((-1 if value is None else value for value in values), dtype=dtype, count=count)
+
+    @staticmethod
+    def _encode(values: typing.Iterable[str], codes: typing.Dict[str, int], count: int) -> np.ndarray:
+        """
+        Replace each value with a small integer code so that comparisons run on integers rather than python strings
+
+        :param values: The values to encode
+        :param codes: The codes that have been assigned to values so far; new values will be added
+        :param count: The number of values
+        :return: The code for each value
+        """
+        return np.fromiter((codes.setdefault(value, len(codes)) for value in values), dtype=np.int16, count=count)
+
+    @staticmethod
+    def code_for(codes: typing.Dict[str, int], value: str) -> int:
+        """
+        :param codes: The codes for a column
+        :param value: A value that may be within the column
+        :return: The code for the value; -1, which matches nothing, if the value isn't in the column
+        """
+        return codes.get(value, -1)
+
+    def _get_code(self, field: str, value: typing.Any) -> int:
+        """
+        :param field: The name of a column
+        :param value: A value that may be within the column
+        :return: What the value looks like within the column
+        """
+        if field == 'model_type':
+            return self.code_for(self.model_type_codes, value)
+        elif field == 'area':
+            return self.code_for(self.area_codes, value)
+
+        return value
+
+    def _get_positions(self, field: str, value: typing.Any) -> np.ndarray:
+        """
+        Find the rows holding a value through an inverted index of the column
+
+        The index for a column is built on first use with a single stable sort of the column, after which each
+        value's rows are one dictionary lookup away
+
+        :param field: The name of a column
+        :param value: The value to look for
+        :return: The positions of every row holding the value, in order
+        """
+        column_positions = self.positions.get(field)
+
+        if column_positions is None:
+            column: np.ndarray = getattr(self, field)
+            order = np.argsort(column, kind='stable')
+            values, starts = np.unique(column[order], return_index=True)
+            column_positions = dict(zip(values.tolist(), np.split(order, starts[1:])))
+            self.positions[field] = column_positions
+
+        return column_positions.get(self._get_code(field, value), _NO_POSITIONS)
+
+    def count(self, **filters) -> int:
+        """
+        Count the rows matching every given filter
+
+        :param filters: The value that matching rows must hold for each filtered column
+        :return: The number of matching rows
+        """
+        if len(filters) == 0:
+            return len(self)
+
+        # Start from the rows of the rarest value so that the other filters are only checked where a match is possible
+        candidates = sorted(
+            ((self._get_positions(field, value), field, value) for field, value in filters.items()),
+            key=lambda candidate: len(candidate[0])
+        )
+        rows, _, _ = candidates[0]
+
+        for _, field, value in candidates[1:]:
+            if len(rows) == 0:
+                break
+            rows = rows[getattr(self, field)[rows] == self._get_code(field, value)]
+
+        return len(rows)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+
+def _series_order(file: File) -> typing.Tuple[str, int, int]:
+    """
+    :param file: A file to place within a configuration
+    :return: A key that places files from the same time series next to each other, in order of their steps
+    """
+    # Files built by hand may be missing attributes, which sort ahead of every real value rather than failing
+    return (
+        "" if file.model_type is None else file.model_type,
+        -1 if file.reference is None else file.reference,
+        -1 if file.step is None else file.step
+    )
 
 
 class Configuration(object):
@@ -89,9 +322,11 @@ class Configuration(object):
         'type',
         'member',
         'files',
-        'key_iterator',
         'loader_module',
-        'day'
+        'day',
+        'file_table',
+        'timeseries_cache',
+        'loaded'
     ]
 
     def __init__(
@@ -123,112 +358,204 @@ class Configuration(object):
         self.files: typing.Dict[str, File] = dict()
         """(:class:`dict`) Files belonging to the given configuration"""
 
-        self.key_iterator = None
-        """An iterator across all keys of the files"""
-
         self.loader_module = loader_module
         """What module will be used to load data (`NOMADSExplorer.explore.local` or `NOMADSExplorer.explore.remote`)"""
 
         self.day = day
         """(:class:`Day`) The day that this configuration belongs to"""
 
+        self.file_table: typing.Optional[FileTable] = None
+        """(:class:`FileTable`) A columnar view of the files, built when first needed"""
+
+        self.timeseries_cache: typing.Optional[typing.Dict[typing.Tuple[str, int], "TimeSeries"]] = None
+        """(:class:`dict`) Every time series formed from the files, keyed by model type and reference"""
+
+        self.loaded: bool = False
+        """(:class:`bool`) Whether the files for this configuration have been loaded"""
+
     def _load_files(self):
         """
         Loads the collection of all files for this configuration
         """
-        if self.files is None or len(self.files) == 0:
-            self.files = {
-                file.name: file
-                for file in self.loader_module.fetch_files(self)
-            }
+        fetched_files = self.loader_module.fetch_files(self)
+
+        if self.files:
+            # Files that were assigned before loading take the place of any fetched file with the same name
+            entries = [(file.name, file) for file in fetched_files if file.name not in self.files]
+            entries.extend(self.files.items())
+            self.files = dict(sorted(entries, key=lambda entry: _series_order(entry[1])))
+        else:
+            # Sorting once here means that every time series is already a contiguous, ordered run within the files
+            files = sorted(fetched_files, key=_series_order)
+
+            # Pair each file with its name entirely in C rather than running a comprehension step per file
+            self.files = dict(zip(map(attrgetter('name'), files), files))
 
-    def all_files(self) -> typing.List[File]:
-        if self.files is None or len(self.files) == 0:
+        self.file_table = None
+        self.timeseries_cache = None
+        self.loaded = True
+
+    def _get_file_table(self) -> FileTable:
+        """
+        :return: A columnar view of all files for this configuration
+        """
+        if not self.loaded:
             self._load_files()
 
-        return list(self.files.values())
+        if self.file_table is None:
+            self.file_table = FileTable(self.files.values())
 
-    def get_timeseries(self, model_type: str, reference: int) -> typing.List[File]:
-        if self.files is None or len(self.files) == 0:
+        return self.file_table
+
+    def all_files(self, materialize: bool = False) -> typing.Union[typing.ValuesView[File], typing.List[File]]:
+        """
+        :param materialize: Whether to copy the files into a new list rather than returning a live view of them
+        :return: Every file belonging to this configuration
+        """
+        if not self.loaded:
             self._load_files()
 
-        return sorted(
-            [file for file in self.files.values() if file.model_type == model_type and file.reference == reference],
-            key=lambda file: file.step
-        )
+        if materialize:
+            return list(self.files.values())
 
-    def get_all_timeseries(self) -> typing.List["TimeSeries"]:
-        if self.files is None or len(self.files) == 0:
+        return self.files.values()
+
+    def _get_timeseries_cache(self) -> typing.Dict[typing.Tuple[str, int], "TimeSeries"]:
+        """
+        :return: Every time series formed from the files, keyed by model type and reference
+        """
+        if self.timeseries_cache is not None:
+            return self.timeseries_cache
+
+        if not self.loaded:
             self._load_files()
 
-        timeseries: typing.List["TimeSeries"] = list()
+        timeseries: typing.Dict[typing.Tuple[str, int], "TimeSeries"] = dict()
+
+        # Files are kept ordered by model type, reference, and step, so each time series is one contiguous run
+        for (model_type, reference), series_files in groupby(
+                self.files.values(),
+                key=attrgetter('model_type', 'reference')
+        ):
+            files: typing.List[File] = list(series_files)
+            timeseries[(model_type, reference)] = TimeSeries(
+                files,
+                reference,
+                self.type,
+                model_type,
+                files[0].area,
+                self.day,
+                self.member,
+                presorted=True
+            )
 
-        # Partition contained files by the model type, then reference
-        partitions: typing.Dict[str, typing.Dict[int, typing.List[File]]] = dict()
+        self.timeseries_cache = timeseries
+        return timeseries
 
-        for file in self.files.values():
-            if file.model_type not in partitions:
-                partitions[file.model_type] = dict()
+    def get_timeseries(self, model_type: str, reference: int) -> typing.List[File]:
+        series = self._get_timeseries_cache().get((model_type, reference))
 
-            if file.reference not in partitions[file.model_type]:
-                partitions[file.model_type][file.reference] = list()
+        if series is None:
+            return list()
 
-            partitions[file.model_type][file.reference].append(file)
+        return list(series.files)
 
-        for model_type, reference_files in partitions.items():
-            for reference, files in reference_files.items():
-                timeseries.append(
-                    TimeSeries(
-                        files,
-                        reference,
-                        self.type,
-                        model_type,
-                        files[0].area if files else None,
-                        self.day,
-                        self.member
-                    )
-                )
+    def get_all_timeseries(self) -> typing.List["TimeSeries"]:
+        return list(self._get_timeseries_cache().values())
 
-        return timeseries
+    def get_file_count(
+            self,
+            name: str = None,
+            reference: int = None,
+            model_type: str = None,
+            step: int = None,
+            area: str = None,
+            member: int = None
+    ) -> int:
+        """
+        Count the files that match every given filter; filters that aren't given match everything
+
+        :param name: The name that counted files must have
+        :param reference: The reference time that counted files must have
+        :param model_type: The type of model that counted files must have
+        :param step: The time step that counted files must have
+        :param area: The area of land that counted files must pertain to
+        :param member: The ensemble member that counted files must belong to
+        :return: The number of matching files
+        """
+        if not self.loaded:
+            self._load_files()
+
+        if name is not None:
+            # Names are unique within a configuration, so at most one file needs to be checked
+            file = self.files.get(name)
+            return int(
+                file is not None
+                and (reference is None or file.reference == reference)
+                and (model_type is None or file.model_type == model_type)
+                and (step is None or file.step == step)
+                and (area is None or file.area == area)
+                and (member is None or file.member == member)
+            )
+
+        filters = {
+            field: value
+            for field, value in zip(_INDEXED_FIELDS, (reference, model_type, step, area, member))
+            if value is not None
+        }
+
+        if len(filters) == 0:
+            return len(self.files)
+
+        return self._get_file_table().count(**filters)
 
     def __getitem__(self, item: str) -> [None, File]:
-        if not isinstance(item, str):
+        # This check is stripped when running under `python -O`
+        if __debug__ and not isinstance(item, str):
             raise Exception("The key for a file in a configuration must be a string")
 
-        if self.files is None or len(self.files) == 0:
+        if not self.loaded:
             self._load_files()
 
         return self.files.get(item, None)
 
     def __setitem__(self, key: str, value: File):
-        if not isinstance(key, str) and not isinstance(value, File):
-            raise Exception("Value cannot be set on configuration; the key is not a string and the value is not a file")
-        elif not isinstance(key, str):
-            raise Exception("Value cannot be set on configuration; the key is not a string")
-        elif not isinstance(value, File):
-            raise Exception("Value cannot be set on configuration; the value is not a File")
+        # These checks are stripped when running under `python -O`
+        if __debug__:
+            if not isinstance(key, str) and not isinstance(value, File):
+                raise Exception(
+                    "Value cannot be set on configuration; the key is not a string and the value is not a file"
+                )
+            elif not isinstance(key, str):
+                raise Exception("Value cannot be set on configuration; the key is not a string")
+            elif not isinstance(value, File):
+                raise Exception("Value cannot be set on configuration; the value is not a File")
+
+        order = _series_order(value)
+        current_file = self.files.get(key)
+
+        if current_file is not None:
+            in_order = _series_order(current_file) == order
+        else:
+            in_order = len(self.files) == 0 or _series_order(self.files[next(reversed(self.files))]) <= order
+
         self.files[key] = value
 
-    def __iter__(self):
-        if self.files is None or len(self.files) == 0:
-            self._load_files()
+        # Files almost always arrive in order, so they only need to be rearranged when one lands out of place
+        if not in_order:
+            self.files = dict(sorted(self.files.items(), key=lambda entry: _series_order(entry[1])))
 
-        self.key_iterator = iter(self.files)
-        return self
+        self.file_table = None
+        self.timeseries_cache = None
 
-    def __next__(self) -> (str, File):
-        if self.files is None or len(self.files) == 0:
+    def __iter__(self) -> typing.Iterator[typing.Tuple[str, File]]:
+        if not self.loaded:
             self._load_files()
 
-        if self.key_iterator is None:
-            self.key_iterator = iter(self.files)
-
-        # This will eventually raise a StopIteration, but we want that
-        next_key = next(self.key_iterator)
-        return next_key, self.files[next_key]
+        yield from self.files.items()
 
     def __len__(self) -> int:
-        if self.files is None or len(self.files) == 0:
+        if not self.loaded:
             self._load_files()
 
         return len(self.files)
@@ -237,13 +564,12 @@ class Configuration(object):
         description = self.type
 
         if self.member is not None:
-            description += ", Member " + str(self.member)
+            description += f", Member {self.member}"
 
-        description += "(files = {})".format(len(self.files))
+        description += f"(files = {len(self.files)})"
         return description
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
 
 class Day(object):
@@ -256,8 +582,9 @@ class Day(object):
         'name',
         'date',
         'configurations',
-        'key_iterator',
-        'loader_module'
+        'loader_module',
+        'loaded',
+        'formatted_date'
     ]
 
     def __init__(self, date: datetime, name: str, address: str, loader_module):
@@ -273,72 +600,114 @@ class Day(object):
         self.name: str = name
         self.date: datetime = date
         self.configurations: typing.Dict[str, Configuration] = dict()
-        self.key_iterator = None
         self.loader_module = loader_module
+        self.loaded: bool = False
+        self.formatted_date: typing.Optional[str] = None
 
     def _load_configurations(self):
         """
         Loads all configurations available for this day
         """
-        if self.configurations is None or len(self.configurations) == 0:
-            self.configurations = {
-                configuration.type: configuration
-                for configuration in self.loader_module.fetch_configurations(self)
-            }
+        configurations = list(self.loader_module.fetch_configurations(self))
+        loaded_configurations = dict(zip(map(attrgetter('type'), configurations), configurations))
+
+        # Configurations that were assigned before loading take the place of any fetched one of the same type
+        loaded_configurations.update(self.configurations)
+
+        self.configurations = loaded_configurations
+        self.loaded = True
 
     def get_date(self) -> str:
         """
         :return: The date in an easily readable format
         """
-        return self.date.strftime("%Y-%m-%d")
+        if self.formatted_date is None:
+            self.formatted_date = self.date.strftime("%Y-%m-%d")
 
-    def __iter__(self):
-        if self.configurations is None or len(self.configurations) == 0:
-            self._load_configurations()
+        return self.formatted_date
 
-        self.key_iterator = iter(self.configurations)
-        return self
+    def prefetch(self, concurrency: int = _DEFAULT_CONCURRENCY):
+        """
+        Load the files for every configuration of this day at the same time rather than one by one
 
-    def __next__(self):
-        if self.configurations is None or len(self.configurations) == 0:
+        :param concurrency: The greatest number of configurations to load at the same time
+        """
+        if not self.loaded:
             self._load_configurations()
 
-        if self.key_iterator is None:
-            self.key_iterator = iter(self.configurations)
+        _load_concurrently(
+            Configuration._load_files,
+            [configuration for configuration in self.configurations.values() if not configuration.loaded],
+            concurrency
+        )
+
+    def get_file_count(
+            self,
+            name: str = None,
+            reference: int = None,
+            model_type: str = None,
+            step: int = None,
+            area: str = None,
+            member: int = None
+    ) -> int:
+        """
+        Count the files across every configuration of this day that match every given filter
+
+        :param name: The name that counted files must have
+        :param reference: The reference time that counted files must have
+        :param model_type: The type of model that counted files must have
+        :param step: The time step that counted files must have
+        :param area: The area of land that counted files must pertain to
+        :param member: The ensemble member that counted files must belong to
+        :return: The number of matching files
+        """
+        self.prefetch()
 
-        # This will eventually raise a StopIteration, but we want it to
-        next_key = next(self.key_iterator)
-        return next_key, self.configurations[next_key]
+        return sum(
+            configuration.get_file_count(name, reference, model_type, step, area, member)
+            for configuration in self.configurations.values()
+        )
 
-    def __getitem__(self, item: str) -> [None, Configuration]:
-        if self.configurations is None or len(self.configurations) == 0:
+    def __iter__(self) -> typing.Iterator[typing.Tuple[str, Configuration]]:
+        if not self.loaded:
             self._load_configurations()
 
-        if not isinstance(item, str):
+        yield from self.configurations.items()
+
+    def __getitem__(self, item: str) -> [None, Configuration]:
+        # This check is stripped when running under `python -O`
+        if __debug__ and not isinstance(item, str):
             raise Exception("The key for a configuration must be a string")
 
+        if not self.loaded:
+            self._load_configurations()
+
         return self.configurations.get(item, None)
 
     def __setitem__(self, key: str, value: Configuration):
-        if not isinstance(key, str) and not isinstance(value, Configuration):
-            raise Exception("Value cannot be set on Day; the key is not a string and the value is not a Configuration")
-        elif not isinstance(key, str):
-            raise Exception("Value cannot be set on Day; the key is not a string")
-        elif not isinstance(value, Configuration):
-            raise Exception("Value cannot be set on Day; the value is not a Configuration")
+        # These checks are stripped when running under `python -O`
+        if __debug__:
+            if not isinstance(key, str) and not isinstance(value, Configuration):
+                raise Exception(
+                    "Value cannot be set on Day; the key is not a string and the value is not a Configuration"
+                )
+            elif not isinstance(key, str):
+                raise Exception("Value cannot be set on Day; the key is not a string")
+            elif not isinstance(value, Configuration):
+                raise Exception("Value cannot be set on Day; the value is not a Configuration")
+
         self.configurations[key] = value
 
     def __len__(self) -> int:
-        if self.configurations is None or len(self.configurations) == 0:
+        if not self.loaded:
             self._load_configurations()
 
         return len(self.configurations)
 
     def __str__(self):
-        return "{} (Configurations = {})".format(self.date, len(self.configurations))
+        return f"{self.date} (Configurations = {len(self.configurations)})"
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
 
 class Catalog(object):
@@ -350,7 +719,6 @@ class Catalog(object):
     __slots__ = [
         'address',
         'days',
-        'key_iterator',
         'loader_module'
     ]
 
@@ -364,15 +732,40 @@ class Catalog(object):
         self.address: str = address
         """(:class:`str`) The location of the root of the catalog"""
 
-        self.days: typing.Dict[datetime, Day] = dict()
-        """All days of forecasts and simulations available within the catalog"""
-
-        self.key_iterator = None
-        """An internal iterator over all contained days"""
+        self.days: typing.Dict[int, Day] = dict()
+        """All days of forecasts and simulations available within the catalog, keyed by the ordinal of their date and
+        kept in chronological order"""
 
         self.loader_module = loader_module
         """What module will load the contained data (`NOMADSExplorer.explore.web` or `NOMADSExplorer.explorer.local`)"""
 
+    def prefetch(self, concurrency: int = _DEFAULT_CONCURRENCY, include_files: bool = False):
+        """
+        Load the configurations for every day at the same time rather than one by one
+
+        :param concurrency: The greatest number of days or configurations to load at the same time
+        :param include_files: Whether to also load the files of every configuration of every day
+        """
+        _load_concurrently(
+            Day._load_configurations,
+            [day for day in self.days.values() if not day.loaded],
+            concurrency
+        )
+
+        if include_files:
+            # Load the configurations of all days in one wave so that the whole pool stays busy rather than
+            # waiting on the slowest configuration of each day
+            _load_concurrently(
+                Configuration._load_files,
+                [
+                    configuration
+                    for day in self.days.values()
+                    for configuration in day.configurations.values()
+                    if not configuration.loaded
+                ],
+                concurrency
+            )
+
     def get_all_timeseries(self, configuration_type: str, model_type: str) -> typing.List["TimeSeries"]:
         """
         Retrieves all time series across all days for the given configuration and model type
@@ -381,63 +774,147 @@ class Catalog(object):
         :param model_type: The type of model run (channel_rt, land, reservoir, etc)
         :return: A list of all matching time series in the catalog
         """
-        timeseries: typing.List["TimeSeries"] = list()
+        self.prefetch()
 
-        for day in self.days.values():
-            configuration = day[configuration_type]
-            timeseries.extend(
-                series
-                for series in configuration.get_all_timeseries()
-                if series.model_type.lower() == model_type.lower()
-            )
+        # Not every day is guaranteed to hold the requested configuration
+        configurations = [day[configuration_type] for day in self.days.values()]
+        configurations = [configuration for configuration in configurations if configuration is not None]
 
-        return timeseries
+        _load_concurrently(
+            Configuration._load_files,
+            [configuration for configuration in configurations if not configuration.loaded],
+            _DEFAULT_CONCURRENCY
+        )
+
+        # Interning the target means each comparison below usually short circuits on identity
+        model_type = sys.intern(model_type.lower())
+
+        return [
+            series
+            for configuration in configurations
+            for series in configuration.get_all_timeseries()
+            if series.normalized_model_type == model_type
+        ]
+
+    def get_file_count(
+            self,
+            name: str = None,
+            reference: int = None,
+            model_type: str = None,
+            step: int = None,
+            area: str = None,
+            member: int = None
+    ) -> int:
+        """
+        Count the files across every day in the catalog that match every given filter
+
+        :param name: The name that counted files must have
+        :param reference: The reference time that counted files must have
+        :param model_type: The type of model that counted files must have
+        :param step: The time step that counted files must have
+        :param area: The area of land that counted files must pertain to
+        :param member: The ensemble member that counted files must belong to
+        :return: The number of matching files
+        """
+        self.prefetch(include_files=True)
+
+        return sum(
+            day.get_file_count(name, reference, model_type, step, area, member)
+            for day in self.days.values()
+        )
+
+    def to_frame(self) -> "pandas.DataFrame":
+        """
+        Lay out every file in the catalog as a table with one column per attribute
+
+        Filtering or grouping the table runs over whole columns at once rather than walking every day, configuration,
+        and file, which pays off when many different questions are asked of the same catalog
+
+        :return: A table with a row for each file in the catalog
+        """
+        # pandas takes longer to import than the rest of the package combined, so only pay for it when it's used
+        import pandas as pd
+
+        self.prefetch(include_files=True)
+
+        files: typing.List[File] = list()
+        dates: typing.List[datetime] = list()
+
+        for day in self.days.values():
+            for configuration in day.configurations.values():
+                files.extend(configuration.files.values())
+                dates.extend([day.date] * len(configuration.files))
+
+        return pd.DataFrame({
+            "date": pd.to_datetime(dates),
+            "configuration": pd.Categorical(list(map(attrgetter('type'), files))),
+            "model_type": pd.Categorical(list(map(attrgetter('model_type'), files))),
+            "area": pd.Categorical(list(map(attrgetter('area'), files))),
+            "reference": pd.array(list(map(attrgetter('reference'), files)), dtype="Int8"),
+            "step": pd.array(list(map(attrgetter('step'), files)), dtype="Int32"),
+            "member": pd.array(list(map(attrgetter('member'), files)), dtype="Int16"),
+            "name": list(map(attrgetter('name'), files)),
+            "address": list(map(attrgetter('address'), files))
+        })
 
     def __len__(self):
         return len(self.days)
 
-    def __iter__(self):
-        self.key_iterator = iter(self.days)
-        return self
+    def __iter__(self) -> typing.Iterator[typing.Tuple[datetime, Day]]:
+        for ordinal, day in self.days.items():
+            yield datetime.fromordinal(ordinal), day
 
-    def __next__(self) -> (datetime, Day):
-        if self.key_iterator is None:
-            self.key_iterator = iter(self.days)
+    def __getitem__(self, key: typing.Union[date, datetime]):
+        # This check is stripped when running under `python -O`
+        if __debug__ and not isinstance(key, date):
+            raise Exception("The key for items in a directory must be a date")
 
-        # This will eventually raise a StopIteration, but we want it to
-        next_key = next(self.key_iterator)
-        return next_key, self.days[next_key]
+        return self.days.get(key.toordinal(), None)
 
-    def __getitem__(self, key: datetime):
-        if not isinstance(key, datetime):
-            raise Exception("The key for items in a directory must be a date and time")
+    def __setitem__(self, key: typing.Union[date, datetime], value: Day):
+        # These checks are stripped when running under `python -O`
+        if __debug__:
+            if not isinstance(key, date) and not isinstance(value, Day):
+                raise Exception(
+                    "The key for the directory must be a date and the value must be a Day; "
+                    "neither are true"
+                )
+            elif not isinstance(key, date):
+                raise Exception("The key in a directory must be a date")
+            elif not isinstance(value, Day):
+                raise Exception("The value in a directory must be a Day")
 
-        return self.days.get(key, None)
+        ordinal = key.toordinal()
+        out_of_order = len(self.days) > 0 and ordinal not in self.days and ordinal < next(reversed(self.days))
 
-    def __setitem__(self, key: datetime, value: Day):
-        if not isinstance(key, datetime) and not isinstance(value, Day):
-            raise Exception(
-                "The key for the directory must be a date and time and the value must be a Day; "
-                "neither are true"
-            )
-        elif not isinstance(key, datetime):
-            raise Exception("The key in a directory must be a date and time")
-        elif not isinstance(value, Day):
-            raise Exception("The value in a directory must be a Day")
+        self.days[ordinal] = value
 
-        self.days[key] = value
+        # Listings almost always come in order, so days only need to be rearranged when one arrives early
+        if out_of_order:
+            self.days = dict(sorted(self.days.items()))
 
     def __str__(self):
-        return "{} (Days = {})".format(self.address, len(self.days))
+        return f"{self.address} (Days = {len(self.days)})"
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
 
 class TimeSeries(object):
     """
     Represents all files making up a time series
     """
+
+    __slots__ = [
+        'files',
+        'reference',
+        'configuration',
+        'model_type',
+        'normalized_model_type',
+        'area',
+        'member',
+        'day'
+    ]
+
     def __init__(
             self,
             files: typing.List[File],
@@ -446,7 +923,8 @@ class TimeSeries(object):
             model_type: str,
             area: str,
             day: Day,
-            member: int = None
+            member: int = None,
+            presorted: bool = False
     ):
         """
         Constructor
@@ -458,8 +936,9 @@ class TimeSeries(object):
         :param area: Over what span of land that the forecast pertains to (CONUS, Hawaii, etc)
         :param day: The day when the forecast began
         :param member: The identifier for the ensemble member if the time series is part of an ensemble
+        :param presorted: Whether the given files are already ordered by step
         """
-        self.files = sorted(files, key=lambda file: file.step)
+        self.files = list(files) if presorted else sorted(files, key=attrgetter('step'))
         """(:class:`list`) All files available to make up this time series"""
 
         self.reference = reference
@@ -471,6 +950,9 @@ class TimeSeries(object):
         self.model_type = model_type
         """(:class:`str`) What model was run (channel_rt, land, reservoir, etc)"""
 
+        self.normalized_model_type = sys.intern(model_type.lower()) if isinstance(model_type, str) else model_type
+        """(:class:`str`) The interned, lower case model type, used to match model types regardless of case"""
+
         self.area = area
         """(:class:`str`) Over what span of land that the forecast pertains to (CONUS, Hawaii, etc)"""
 
@@ -480,33 +962,19 @@ class TimeSeries(object):
         self.day = day
         """(:class:`Day`) The day when the forecast began"""
 
-        self.file_iterator = None
-        """An internal iterator across all files"""
-
-    def __iter__(self):
-        self.file_iterator = iter(self.files)
-        return self
-
-    def __next__(self):
-        if self.file_iterator is None:
-            self.file_iterator = iter(self.files)
-
-        return next(self.file_iterator)
+    def __iter__(self) -> typing.Iterator[File]:
+        yield from self.files
 
     def __str__(self):
-        string = "{} {} over {} at t{}Z on {}".format(
-            self.configuration,
-            self.model_type,
-            self.area,
-            str(self.reference).zfill(2),
-            self.day.get_date()
+        string = (
+            f"{self.configuration} {self.model_type} over {self.area} "
+            f"at t{str(self.reference).zfill(2)}Z on {self.day.get_date()}"
         )
 
         if self.member is not None:
-            string += ", ensemble member {}".format(self.member)
+            string += f", ensemble member {self.member}"
 
-        string += " (Steps = {})".format(len(self.files))
+        string += f" (Steps = {len(self.files)})"
         return string
 
-    def __repr__(self):
-        return str(self)
+    __repr__ = __str__
@@ -8,13 +8,9 @@ import os
 import typing
 import logging
 
-from datetime import datetime
-
 import NOMADSExplorer.explore.catalog as catalog
 import NOMADSExplorer.common as common
 
-_DAY_FORMAT = "%Y%m%d"
-
 LOADER_MODULE = sys.modules[__name__]
 
 
@@ -35,7 +31,7 @@ def form_configuration(day: catalog.Day, address: str, directory: str) -> catalo
         configuration = directory.replace("_mem" + str(member), "")
 
     return catalog.Configuration(
-        configuration_type=configuration.strip("/"),
+        configuration_type=sys.intern(configuration.strip("/")),
         address=os.path.join(address, directory),
         loader_module=LOADER_MODULE,
         day=day
@@ -50,18 +46,7 @@ def form_configuration_file(directory: str, filename: str) -> catalog.File:
     :param filename: the name of the file in the configuration
     :return: An object containing the metadata for the discovered file
     """
-    attributes = common.extract_file_attributes(filename)
-    configuration_file = catalog.File(
-        name=filename,
-        address=os.path.join(directory, filename),
-        reference=attributes['reference'],
-        configuration=attributes['configuration'],
-        model_type=attributes['model_type'],
-        step=attributes['step'],
-        area=attributes['area'],
-        member=attributes.get("member")
-    )
-    return configuration_file
+    return catalog.File.from_parts(filename, os.path.join(directory, filename), *common.parse_file_name(filename))
 
 
 def get_catalog(url: str = None) -> catalog.Catalog:
@@ -70,15 +55,16 @@ def get_catalog(url: str = None) -> catalog.Catalog:
 
     catalog_contents = catalog.Catalog(url, loader_module=LOADER_MODULE)
 
-    for directory in os.listdir(url):
-        if directory.startswith("nwm"):
-            date = datetime.strptime(directory[4:-1], _DAY_FORMAT)
-            catalog_contents[date] = catalog.Day(
-                date=date,
-                name=directory.strip("/"),
-                address=os.path.join(url, directory),
-                loader_module=LOADER_MODULE
-            )
+    with os.scandir(url) as entries:
+        for entry in entries:
+            if entry.name.startswith("nwm") and entry.is_dir():
+                date = common.get_date_from_directory_name(entry.name)
+                catalog_contents[date] = catalog.Day(
+                    date=date,
+                    name=entry.name.strip("/"),
+                    address=entry.path,
+                    loader_module=LOADER_MODULE
+                )
 
     logging.debug("{} forecast days were found for a new catalog".format(len(catalog_contents)))
 
@@ -88,15 +74,17 @@ def get_catalog(url: str = None) -> catalog.Catalog:
 def fetch_configurations(day: catalog.Day) -> typing.List[catalog.Configuration]:
     logging.debug("Getting configurations for {}".format(day))
 
-    discovered_configurations = [
-        form_configuration(
-            day,
-            day.address,
-            directory
-        )
-        for directory in os.listdir(day.address)
-        if os.path.isdir(os.path.join(day.address, directory))
-    ]
+    # scandir reports whether each entry is a directory from the listing itself rather than a stat per entry
+    with os.scandir(day.address) as entries:
+        discovered_configurations = [
+            form_configuration(
+                day,
+                day.address,
+                entry.name
+            )
+            for entry in entries
+            if entry.is_dir()
+        ]
 
     logging.debug("{} configurations found for {}".format(len(discovered_configurations), day))
 
@@ -104,15 +92,13 @@ def fetch_configurations(day: catalog.Day) -> typing.List[catalog.Configuration]
 
 
 def fetch_files(configuration: catalog.Configuration) -> typing.List[catalog.File]:
-    discovered_files: typing.List[catalog.File] = [
-        form_configuration_file(
-            configuration.address,
-            file
-        )
-        for file in os.listdir(configuration.address)
-        if os.path.isfile(os.path.join(configuration.address, file))
-            and file.endswith(".nc")
-    ]
+    # Check the name before asking whether the entry is a file since the string check is far cheaper
+    with os.scandir(configuration.address) as entries:
+        discovered_files: typing.List[catalog.File] = [
+            form_configuration_file(configuration.address, entry.name)
+            for entry in entries
+            if entry.name.endswith(".nc") and entry.is_file()
+        ]
 
     return discovered_files
 
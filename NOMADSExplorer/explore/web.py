@@ -7,22 +7,31 @@ import sys
 import os
 import typing
 import logging
+import hashlib
+import math
+import json
+import tempfile
+import time
+import re
+import html
 
-from datetime import datetime
+from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import NOMADSExplorer.explore.catalog as catalog
 import NOMADSExplorer.common as common
 
-# Try to use lxml for html parsing; if it's not there, fall back to the standard
+# Try to use lxml for html parsing; if it's not there, fall back to BeautifulSoup with the standard parser
 try:
-    import lxml
-    HTML_PARSER = 'lxml'
+    from lxml import html as lxml_html
 except ImportError:
-    logging.warn("lxml is not installed; falling back to the standard html parser for remote exploration")
-    HTML_PARSER = 'html.parser'
+    logging.warning("lxml is not installed; falling back to the standard html parser for remote exploration")
+    lxml_html = None
 
 
 _NOMADS_ADDRESS = os.environ.get(
@@ -31,54 +40,285 @@ _NOMADS_ADDRESS = os.environ.get(
 )
 """(:class:`str`) The address used to connect to a NOMADS-like structure"""
 
-_DAY_FORMAT = "%Y%m%d"
+_CACHE_DIRECTORY = os.environ.get("NOMADS_CACHE_DIRECTORY")
+"""(:class:`str`) Where to keep listings so that unchanged listings aren't downloaded again; nothing is kept if unset"""
+
+
+def _read_cache_expiration() -> float:
+    """
+    :return: The number of seconds given by `NOMADS_CACHE_EXPIRATION`; 0 if it is unset or isn't a finite number
+    """
+    configured_expiration = os.environ.get("NOMADS_CACHE_EXPIRATION") or "0"
+
+    try:
+        expiration = float(configured_expiration)
+    except ValueError:
+        expiration = math.nan
+
+    if not math.isfinite(expiration):
+        logging.warning(
+            "NOMADS_CACHE_EXPIRATION must be a number of seconds, not '{}'; kept listings will always be "
+            "rechecked".format(configured_expiration)
+        )
+        return 0.0
+
+    return expiration
+
+
+_CACHE_EXPIRATION = _read_cache_expiration()
+"""(:class:`float`) How many seconds a kept listing is trusted without asking the server whether it has changed"""
+
+_CONNECTION_POOL_SIZE = 32
+"""(:class:`int`) The greatest number of connections to keep open to a single host"""
+
+_REQUEST_TIMEOUT = (3.05, 30)
+"""(:class:`tuple`) How many seconds to wait to connect to the server and then to wait on its response"""
 
 LOADER_MODULE = sys.modules[__name__]
 
 
-def form_configuration(day: catalog.Day, address: str, link) -> catalog.Configuration:
+def _create_session() -> requests.Session:
+    """
+    Create a session that keeps connections alive so that every listing doesn't need its own TCP and TLS handshake
+
+    :return: A session with a pool of connections that retries failed requests
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_CONNECTION_POOL_SIZE,
+        pool_maxsize=_CONNECTION_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+"""(:class:`requests.Session`) The session shared by every request for a listing"""
+
+_SIMPLE_LINK_PATTERN = re.compile(rb'<a\s+href="([^"]*)"\s*>([^<]*)</a>', re.IGNORECASE)
+"""(:class:`re.Pattern`) Matches plain listing links, like '<a href="nwm.20201014/">nwm.20201014/</a>'"""
+
+_LINK_START_PATTERN = re.compile(rb"<a[\s>]", re.IGNORECASE)
+"""(:class:`re.Pattern`) Matches the start of any link, however it is written"""
+
+_LINK_STRAINER = SoupStrainer("a")
+"""(:class:`bs4.SoupStrainer`) Limits the tree that BeautifulSoup builds to just the links of a listing"""
+
+
+def _parse_links(content: bytes) -> typing.List[typing.Tuple[str, str]]:
+    """
+    Find every link within a directory listing
+
+    :param content: The raw body of the listing
+    :return: The text and target of every link in the listing
+    """
+    # Generated directory listings only hold plain links, which a single regex scan can read far faster than building
+    # an html tree. If any link is written some other way, the whole listing is handed to an actual html parser
+    simple_links = _SIMPLE_LINK_PATTERN.findall(content)
+
+    if len(simple_links) == len(_LINK_START_PATTERN.findall(content)):
+        return [
+            (html.unescape(text.decode("utf-8", "replace")), html.unescape(href.decode("utf-8", "replace")))
+            for href, text in simple_links
+        ]
+
+    if lxml_html is not None:
+        # lxml walks the links in C and decodes the raw bytes itself, skipping BeautifulSoup's python-level tree
+        return [(link.text_content(), link.get("href", "")) for link in lxml_html.fromstring(content).iter("a")]
+
+    # Listings are utf-8 (or plain ascii), so naming the encoding spares BeautifulSoup from sniffing for it
+    web_listing = BeautifulSoup(content, features="html.parser", parse_only=_LINK_STRAINER, from_encoding="utf-8")
+    return [(link.text, link.get("href", "")) for link in web_listing.find_all("a")]
+
+
+def _get_cache_path(url: str) -> str:
+    """
+    :param url: The address of a listing
+    :return: Where the links of the listing are kept
+    """
+    return os.path.join(_CACHE_DIRECTORY, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_cached_listing(url: str) -> typing.Optional[dict]:
+    """
+    :param url: The address of a listing
+    :return: The links and validators that were kept from the last time the listing was retrieved, if there are any
+    """
+    if _CACHE_DIRECTORY is None:
+        return None
+
+    try:
+        with open(_get_cache_path(url)) as cache_file:
+            cached_listing = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    # Anything that doesn't look like what `_write_cached_listing` writes is treated as if nothing was kept
+    if not isinstance(cached_listing, dict) or not isinstance(cached_listing.get("links"), list):
+        return None
+
+    if not all(
+        isinstance(link, list) and len(link) == 2 and isinstance(link[0], str) and isinstance(link[1], str)
+        for link in cached_listing["links"]
+    ):
+        return None
+
+    if not all(isinstance(cached_listing.get(validator), (str, type(None))) for validator in ("etag", "last_modified")):
+        return None
+
+    retrieved = cached_listing.get("retrieved", 0)
+    if not isinstance(retrieved, (int, float)) or isinstance(retrieved, bool):
+        return None
+
+    return cached_listing
+
+
+def _write_cached_listing(
+        url: str,
+        etag: typing.Optional[str],
+        last_modified: typing.Optional[str],
+        links: typing.List[typing.Tuple[str, str]]
+):
+    """
+    Keep the links of a listing along with what the server needs to tell whether the listing has changed since
+
+    :param url: The address of the listing
+    :param etag: The identifier that the server gave the version of the listing
+    :param last_modified: When the server said that the listing last changed
+    :param links: The text and target of every link in the listing
+    """
+    if _CACHE_DIRECTORY is None:
+        return
+
+    # A listing that can't be checked for changes is only worth keeping if it may be trusted for a while
+    if etag is None and last_modified is None and _CACHE_EXPIRATION <= 0:
+        return
+
+    temporary_path: typing.Optional[str] = None
+
+    # The listing has already been retrieved, so failing to keep it should never fail the request for it
+    try:
+        os.makedirs(_CACHE_DIRECTORY, exist_ok=True)
+
+        # Write to a temporary file first so that a concurrent reader never sees a partially written listing
+        with tempfile.NamedTemporaryFile("w", dir=_CACHE_DIRECTORY, suffix=".tmp", delete=False) as cache_file:
+            temporary_path = cache_file.name
+            json.dump(
+                {"etag": etag, "last_modified": last_modified, "retrieved": time.time(), "links": links},
+                cache_file
+            )
+
+        os.replace(temporary_path, _get_cache_path(url))
+    except (OSError, TypeError, ValueError) as error:
+        logging.warning("The listing for {} could not be kept in {}: {}".format(url, _CACHE_DIRECTORY, error))
+
+        if temporary_path is not None:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+
+def _get_listing(url: str) -> typing.List[typing.Tuple[str, str]]:
+    """
+    Retrieve a directory listing and find every link within it
+
+    If a copy of the listing was kept, it is used as is if it was retrieved within the last `NOMADS_CACHE_EXPIRATION`
+    seconds; otherwise the server is asked to only send the listing if it has changed
+
+    :param url: The address of the listing
+    :return: The text and target of every link in the listing
+    """
+    cached_listing = _read_cached_listing(url)
+    headers = dict()
+
+    if cached_listing is not None:
+        if time.time() - cached_listing.get("retrieved", 0) < _CACHE_EXPIRATION:
+            return [(text, href) for text, href in cached_listing["links"]]
+
+        if cached_listing.get("etag"):
+            headers["If-None-Match"] = cached_listing["etag"]
+        if cached_listing.get("last_modified"):
+            headers["If-Modified-Since"] = cached_listing["last_modified"]
+
+    with _SESSION.get(url, headers=headers, timeout=_REQUEST_TIMEOUT) as response:
+        if response.status_code == 304 and cached_listing is not None:
+            links = [(text, href) for text, href in cached_listing["links"]]
+
+            # The server vouched for the kept listing, so it may be trusted for another full expiration window
+            if _CACHE_EXPIRATION > 0:
+                _write_cached_listing(url, cached_listing.get("etag"), cached_listing.get("last_modified"), links)
+
+            return links
+
+        if response.status_code >= 400:
+            raise Exception(
+                "The web service hosting NWM data could not be reached at {}. ({})".format(url, response.status_code)
+            )
+
+        links = _parse_links(response.content)
+        _write_cached_listing(url, response.headers.get("ETag"), response.headers.get("Last-Modified"), links)
+
+    return links
+
+
+def _as_base(address: str) -> str:
+    """
+    :param address: The address of a directory listing
+    :return: The address with a trailing slash so that relative links are resolved within the directory
+    """
+    return address if address.endswith("/") else address + "/"
+
+
+def _resolve(base_address: str, href: str) -> str:
+    """
+    :param base_address: The address of a directory listing, ending with a '/'
+    :param href: Where a link within the listing points
+    :return: The full address that the link points to
+    """
+    # Listings link to their entries by bare name, which only needs to be appended to the address of the listing
+    if ":" in href or href.startswith(("/", ".", "?", "#")):
+        return urljoin(base_address, href)
+
+    return base_address + href
+
+
+def form_configuration(day: catalog.Day, address: str, text: str, href: str) -> catalog.Configuration:
     """
     Form a Configuration object based on a parsed link
 
     :param day: The day of which this configuration coincides
-    :param address: The address for the page that contained this link
-    :param link: The discovered link
+    :param address: The address for the page that contained this link, ending with a '/'
+    :param text: The text of the discovered link
+    :param href: Where the discovered link points
     :return: A configuration object that may contain individual forecasts
     """
-    member = common.get_int_from_word(link.text)
+    member = common.get_int_from_word(text)
     if member is None:
-        configuration = link.text
+        configuration = text
     else:
-        configuration = link.text.replace("_mem" + str(member), "")
+        configuration = text.replace("_mem" + str(member), "")
 
     return catalog.Configuration(
-        configuration_type=configuration.strip("/"),
-        address=os.path.join(address, link['href']),
+        configuration_type=sys.intern(configuration.strip("/")),
+        address=_resolve(address, href),
         loader_module=LOADER_MODULE,
         day=day
     )
 
 
-def form_configuration_file(address: str, link) -> catalog.File:
+def form_configuration_file(address: str, text: str, href: str) -> catalog.File:
     """
     Creates metadata for files that belong to a configuration
 
-    :param address: The address of the configuration
-    :param link: The parsed link to the file
+    :param address: The address of the configuration, ending with a '/'
+    :param text: The text of the link to the file
+    :param href: Where the link to the file points
     :return: An object containing the metadata for the discovered file
     """
-    attributes = common.extract_file_attributes(link.text)
-    configuration_file = catalog.File(
-        name=link.text,
-        address=os.path.join(address, link['href']),
-        reference=attributes['reference'],
-        configuration=attributes['configuration'],
-        model_type=attributes['model_type'],
-        step=attributes['step'],
-        area=attributes['area'],
-        member=attributes.get("member")
-    )
-    return configuration_file
+    return catalog.File.from_parts(text, _resolve(address, href), *common.parse_file_name(text))
 
 
 def get_catalog(url: str = None) -> catalog.Catalog:
@@ -91,25 +331,22 @@ def get_catalog(url: str = None) -> catalog.Catalog:
     if url is None:
         url = _NOMADS_ADDRESS
 
-    with requests.get(url) as response:
-        if response.status_code >= 400:
-            raise Exception("The web service hosting NWM data could not be reached. ({})".format(response.status_code))
-
-        logging.debug("Getting information about the latest forecasts or simulations for a new catalog")
+    logging.debug("Getting information about the latest forecasts or simulations for a new catalog")
 
-        web_listing = BeautifulSoup(response.text, features=HTML_PARSER)
+    links = _get_listing(url)
 
-        logging.debug("Information about the latest forecasts were found for a new catalog")
+    logging.debug("Information about the latest forecasts were found for a new catalog")
 
     catalog_contents = catalog.Catalog(url, loader_module=LOADER_MODULE)
+    base_address = _as_base(url)
 
-    for link in web_listing.find_all("a"):
-        if link.text.startswith("nwm"):
-            date = datetime.strptime(link.text[4:-1], _DAY_FORMAT)
+    for text, href in links:
+        if text.startswith("nwm"):
+            date = common.get_date_from_directory_name(text)
             catalog_contents[date] = catalog.Day(
                 date=date,
-                name=link.text.strip("/"),
-                address=os.path.join(url, link['href']),
+                name=text.strip("/"),
+                address=_resolve(base_address, href),
                 loader_module=LOADER_MODULE
             )
 
@@ -123,18 +360,18 @@ def fetch_configurations(day: catalog.Day) -> typing.List[catalog.Configuration]
 
     logging.debug("Getting configurations for {}".format(day))
 
-    with requests.get(day.address) as response:
-        web_listing = BeautifulSoup(response.text, features=HTML_PARSER)
+    base_address = _as_base(day.address)
 
-    for configuration_entry in web_listing.find_all("a"):
-        if configuration_entry.text == 'Parent Directory':
+    for text, href in _get_listing(day.address):
+        if text == 'Parent Directory':
             continue
 
         discovered_configurations.append(
             form_configuration(
                 day,
-                day.address,
-                configuration_entry
+                base_address,
+                text,
+                href
             )
         )
 
@@ -144,19 +381,13 @@ def fetch_configurations(day: catalog.Day) -> typing.List[catalog.Configuration]
 
 
 def fetch_files(configuration: catalog.Configuration) -> typing.List[catalog.File]:
-    discovered_files: typing.List[catalog.File] = list()
-
-    with requests.get(configuration.address) as response:
-        web_listing = BeautifulSoup(response.text, features=HTML_PARSER)
-
-    for file_link in web_listing.find_all("a"):
-        if file_link.text.endswith(".nc"):
-            discovered_files.append(
-                form_configuration_file(
-                    configuration.address,
-                    file_link
-                )
-            )
+    base_address = _as_base(configuration.address)
+
+    discovered_files: typing.List[catalog.File] = [
+        form_configuration_file(base_address, text, href)
+        for text, href in _get_listing(configuration.address)
+        if text.endswith(".nc")
+    ]
 
     return discovered_files
 